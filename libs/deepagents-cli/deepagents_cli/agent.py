@@ -4,14 +4,6 @@ import os
 import shutil
 from pathlib import Path
 
-from deepagents import create_deep_agent
-from deepagents.backends import CompositeBackend
-from deepagents.backends.filesystem import FilesystemBackend
-from deepagents.middleware.resumable_shell import ResumableShellToolMiddleware
-from langchain.agents.middleware import HostExecutionPolicy
-from langgraph.checkpoint.memory import InMemorySaver
-
-from .agent_memory import AgentMemoryMiddleware
 from .config import COLORS, config, console, get_default_coding_instructions
 
 
@@ -19,7 +11,14 @@ def list_agents():
     """List all available agents."""
     agents_dir = Path.home() / ".deepagents"
 
-    if not agents_dir.exists() or not any(agents_dir.iterdir()):
+    # One directory scan; DirEntry.is_dir() reuses the type info from the listing
+    try:
+        with os.scandir(agents_dir) as entries:
+            agent_names = sorted(entry.name for entry in entries if entry.is_dir())
+    except FileNotFoundError:
+        agent_names = []
+
+    if not agent_names:
         console.print("[yellow]No agents found.[/yellow]")
         console.print(
             "[dim]Agents will be created in ~/.deepagents/ when you first use them.[/dim]",
@@ -29,19 +28,18 @@ def list_agents():
 
     console.print("\n[bold]Available Agents:[/bold]\n", style=COLORS["primary"])
 
-    for agent_path in sorted(agents_dir.iterdir()):
-        if agent_path.is_dir():
-            agent_name = agent_path.name
-            agent_md = agent_path / "agent.md"
+    for agent_name in agent_names:
+        agent_path = agents_dir / agent_name
+        agent_md = agent_path / "agent.md"
 
-            if agent_md.exists():
-                console.print(f"  • [bold]{agent_name}[/bold]", style=COLORS["primary"])
-                console.print(f"    {agent_path}", style=COLORS["dim"])
-            else:
-                console.print(
-                    f"  • [bold]{agent_name}[/bold] [dim](incomplete)[/dim]", style=COLORS["tool"]
-                )
-                console.print(f"    {agent_path}", style=COLORS["dim"])
+        if agent_md.exists():
+            console.print(f"  • [bold]{agent_name}[/bold]", style=COLORS["primary"])
+            console.print(f"    {agent_path}", style=COLORS["dim"])
+        else:
+            console.print(
+                f"  • [bold]{agent_name}[/bold] [dim](incomplete)[/dim]", style=COLORS["tool"]
+            )
+            console.print(f"    {agent_path}", style=COLORS["dim"])
 
     console.print()
 
@@ -140,6 +138,16 @@ The todo list is a planning tool - use it judiciously to avoid overwhelming the
 
 def create_agent_with_config(model, assistant_id: str, tools: list):
     """Create and configure an agent with the specified model and tools."""
+    # Imported here so `list` and `reset` don't load the langchain/langgraph stack
+    from deepagents import create_deep_agent
+    from deepagents.backends import CompositeBackend
+    from deepagents.backends.filesystem import FilesystemBackend
+    from deepagents.middleware.resumable_shell import ResumableShellToolMiddleware
+    from langchain.agents.middleware import HostExecutionPolicy, InterruptOnConfig
+    from langgraph.checkpoint.memory import InMemorySaver
+
+    from .agent_memory import AgentMemoryMiddleware
+
     shell_middleware = ResumableShellToolMiddleware(
         workspace_root=os.getcwd(), execution_policy=HostExecutionPolicy()
     )
@@ -228,8 +236,6 @@ def create_agent_with_config(model, assistant_id: str, tools: list):
         )
 
     # Configure human-in-the-loop for potentially destructive tools
-    from langchain.agents.middleware import InterruptOnConfig
-
     shell_interrupt_config: InterruptOnConfig = {
         "allowed_decisions": ["approve", "reject"],
         "description": lambda tool_call, state, runtime: (
@@ -19,6 +19,9 @@ from prompt_toolkit.key_binding import KeyBindings
 
 from .config import COLORS, COMMANDS, COMMON_BASH_COMMANDS, SessionState, console
 
+# Match @filename, allowing escaped spaces
+FILE_MENTION_PATTERN = re.compile(r"@((?:[^\s@]|(?<=\\)\s)+)")
+
 
 class FilePathCompleter(Completer):
     """File path completer that triggers on @ symbol with case-insensitive matching."""
@@ -125,8 +128,7 @@ class BashCompleter(Completer):
 
 def parse_file_mentions(text: str) -> tuple[str, list[Path]]:
     """Extract @file mentions and return cleaned text with resolved file paths."""
-    pattern = r"@((?:[^\s@]|(?<=\\)\s)+)"  # Match @filename, allowing escaped spaces
-    matches = re.findall(pattern, text)
+    matches = FILE_MENTION_PATTERN.findall(text)
 
     files = []
     for match in matches:
@@ -3,45 +3,30 @@
 import argparse
 import asyncio
 import sys
+from collections.abc import Callable, Coroutine
 from pathlib import Path
+from typing import Any, TypeVar
 
-from .agent import create_agent_with_config, list_agents, reset_agent
-from .commands import execute_bash_command, handle_command
-from .config import COLORS, DEEP_AGENTS_ASCII, SessionState, console, create_model
-from .execution import execute_task
-from .input import create_prompt_session
-from .tools import http_request, tavily_client, web_search
-from .ui import TokenTracker, show_help
+# Must match pyproject.toml (enforced by tests) so `--version` needs no package metadata
+__version__ = "0.0.7"
+_VERSION_TEXT = f"deepagents {__version__}"
+
+T = TypeVar("T")
 
 
 def check_cli_dependencies():
     """Check if CLI optional dependencies are installed."""
-    missing = []
-
-    try:
-        import rich
-    except ImportError:
-        missing.append("rich")
-
-    try:
-        import requests
-    except ImportError:
-        missing.append("requests")
-
-    try:
-        import dotenv
-    except ImportError:
-        missing.append("python-dotenv")
-
-    try:
-        import tavily
-    except ImportError:
-        missing.append("tavily-python")
-
-    try:
-        import prompt_toolkit
-    except ImportError:
-        missing.append("prompt-toolkit")
+    from importlib.util import find_spec
+
+    # (module name, pip package name) - find_spec locates modules without executing them
+    dependencies = [
+        ("rich", "rich"),
+        ("requests", "requests"),
+        ("dotenv", "python-dotenv"),
+        ("tavily", "tavily-python"),
+        ("prompt_toolkit", "prompt-toolkit"),
+    ]
+    missing = [package for module, package in dependencies if find_spec(module) is None]
 
     if missing:
         print("\n❌ Missing required CLI dependencies!")
@@ -78,6 +63,14 @@ def parse_args():
         "--target", dest="source_agent", help="Copy prompt from another agent"
     )
 
+    parser.add_argument(
+        "-v",
+        "--version",
+        action="version",
+        version=_VERSION_TEXT,
+        help="Show the installed version and exit",
+    )
+
     # Default interactive mode
     parser.add_argument(
         "--agent",
@@ -95,6 +88,13 @@ def parse_args():
 
 async def simple_cli(agent, assistant_id: str | None, session_state, baseline_tokens: int = 0):
     """Main CLI loop."""
+    from .commands import execute_bash_command, handle_command
+    from .config import COLORS, DEEP_AGENTS_ASCII, console
+    from .execution import execute_task
+    from .input import create_prompt_session
+    from .tools import tavily_client
+    from .ui import TokenTracker
+
     console.clear()
     console.print(DEEP_AGENTS_ASCII, style=f"bold {COLORS['primary']}")
     console.print()
@@ -172,6 +172,11 @@ async def simple_cli(agent, assistant_id: str | None, session_state, baseline_to
 
 async def main(assistant_id: str, session_state):
     """Main entry point."""
+    from .agent import create_agent_with_config, get_system_prompt
+    from .config import console, create_model
+    from .token_utils import calculate_baseline_tokens
+    from .tools import http_request, tavily_client, web_search
+
     # Create the model (checks API keys)
     model = create_model()
 
@@ -183,9 +188,6 @@ async def main(assistant_id: str, session_state):
     agent = create_agent_with_config(model, assistant_id, tools)
 
     # Calculate baseline token count for accurate token tracking
-    from .agent import get_system_prompt
-    from .token_utils import calculate_baseline_tokens
-
     agent_dir = Path.home() / ".deepagents" / assistant_id
     system_prompt = get_system_prompt()
     baseline_tokens = calculate_baseline_tokens(model, agent_dir, system_prompt)
@@ -196,8 +198,30 @@ async def main(assistant_id: str, session_state):
         console.print(f"\n[bold red]❌ Error:[/bold red] {e}\n")
 
 
+def get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's event loop factory if it is installed, else None for asyncio's default."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a single, explicitly closed event loop."""
+    with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+        return runner.run(coro)
+
+
 def cli_main():
     """Entry point for console script."""
+    # Answer version queries before paying for dependency checks or heavy imports
+    if sys.argv[1:2] in (["-v"], ["--version"]):
+        print(_VERSION_TEXT)
+        sys.exit(0)
+
     # Check dependencies first
     check_cli_dependencies()
 
@@ -205,18 +229,28 @@ def cli_main():
         args = parse_args()
 
         if args.command == "help":
+            from .ui import show_help
+
             show_help()
         elif args.command == "list":
+            from .agent import list_agents
+
             list_agents()
         elif args.command == "reset":
+            from .agent import reset_agent
+
             reset_agent(args.agent, args.source_agent)
         else:
+            from .config import SessionState
+
             # Create session state from args
             session_state = SessionState(auto_approve=args.auto_approve)
 
             # API key validation happens in create_model()
-            asyncio.run(main(args.agent, session_state))
+            _run(main(args.agent, session_state))
     except KeyboardInterrupt:
+        from .config import console
+
         # Clean exit on Ctrl+C - suppress ugly traceback
         console.print("\n\n[yellow]Interrupted[/yellow]")
         sys.exit(0)
@@ -1,17 +1,41 @@
 """Custom tools for the CLI agent."""
 
 import os
-from typing import Any, Literal
+from http.cookiejar import DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any, Literal
 
 import requests
-from tavily import TavilyClient
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from tavily import TavilyClient
+
+
+def _create_tavily_client() -> "TavilyClient | None":
+    """Create a Tavily client if an API key is available.
+
+    The Tavily SDK is only imported when a key is set, so sessions without
+    web search don't pay for loading it.
+    """
+    api_key = os.environ.get("TAVILY_API_KEY")
+    if not api_key:
+        return None
+
+    from tavily import TavilyClient
+
+    return TavilyClient(api_key=api_key)
+
 
 # Initialize Tavily client if API key is available
-tavily_client = (
-    TavilyClient(api_key=os.environ.get("TAVILY_API_KEY"))
-    if os.environ.get("TAVILY_API_KEY")
-    else None
-)
+tavily_client = _create_tavily_client()
+
+# One session for all http_request calls so keep-alive connections are pooled.
+# Its cookie policy rejects every cookie, keeping unrelated requests isolated.
+_http_session = requests.Session()
+_http_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_http_adapter = HTTPAdapter()
+_http_session.mount("http://", _http_adapter)
+_http_session.mount("https://", _http_adapter)
 
 
 def http_request(
@@ -48,7 +72,7 @@ def http_request(
             else:
                 kwargs["data"] = data
 
-        response = requests.request(**kwargs)
+        response = _http_session.request(**kwargs)
 
         try:
             content = response.json()
@@ -1,8 +1,10 @@
 """UI rendering and display utilities for the CLI."""
 
+from __future__ import annotations
+
 import json
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rich import box
 from rich.panel import Panel
@@ -10,7 +12,10 @@ from rich.syntax import Syntax
 from rich.text import Text
 
 from .config import COLORS, COMMANDS, DEEP_AGENTS_ASCII, MAX_ARG_LENGTH, console
-from .file_ops import FileOperationRecord
+
+if TYPE_CHECKING:
+    # file_ops imports the deepagents package, which would drag langchain into `help`
+    from .file_ops import FileOperationRecord
 
 
 def truncate_value(value: str, max_length: int = MAX_ARG_LENGTH) -> str:
@@ -421,6 +426,7 @@ def show_help():
         "  deepagents reset --agent AGENT --target SOURCE Reset agent to copy of another agent"
     )
     console.print("  deepagents help                                Show this help message")
+    console.print("  deepagents --version                           Show the installed version")
     console.print()
 
     console.print("[bold]Examples:[/bold]", style=COLORS["primary"])
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from deepagents_cli.agent import list_agents
+
+
+def test_list_agents_without_agents_dir(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+    list_agents()
+
+    assert "No agents found." in capsys.readouterr().out
+
+
+def test_list_agents_lists_directories_only(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    agents_dir = tmp_path / ".deepagents"
+    (agents_dir / "beta").mkdir(parents=True)
+    (agents_dir / "alpha").mkdir()
+    (agents_dir / "alpha" / "agent.md").write_text("prompt")
+    (agents_dir / "notes.txt").write_text("not an agent")
+
+    list_agents()
+
+    out = capsys.readouterr().out
+    assert out.index("alpha") < out.index("beta")
+    assert "beta (incomplete)" in out
+    assert "alpha (incomplete)" not in out
+    assert "notes.txt" not in out
@@ -0,0 +1,119 @@
+import os
+import subprocess
+import sys
+import tomllib
+from pathlib import Path
+
+import pytest
+
+from deepagents_cli.main import (
+    __version__,
+    _run,
+    check_cli_dependencies,
+    cli_main,
+    get_loop_factory,
+)
+
+
+@pytest.mark.parametrize("flag", ["-v", "--version"])
+def test_version_flag_skips_heavy_imports(monkeypatch, capsys, flag):
+    monkeypatch.setattr(sys, "argv", ["deepagents", flag])
+    for name in ("deepagents_cli.agent", "deepagents_cli.config"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli_main()
+
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out.strip() == f"deepagents {__version__}"
+    assert "deepagents_cli.agent" not in sys.modules
+    assert "deepagents_cli.config" not in sys.modules
+
+
+def test_version_matches_pyproject():
+    pyproject = Path(__file__).parents[1] / "pyproject.toml"
+    with pyproject.open("rb") as f:
+        project_version = tomllib.load(f)["project"]["version"]
+
+    assert __version__ == project_version
+
+
+def test_check_cli_dependencies_does_not_import_modules(monkeypatch):
+    monkeypatch.delitem(sys.modules, "tavily", raising=False)
+
+    check_cli_dependencies()
+
+    assert "tavily" not in sys.modules
+
+
+def test_check_cli_dependencies_reports_missing_package(monkeypatch, capsys):
+    import importlib.util
+
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name: None if name == "dotenv" else real_find_spec(name),
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        check_cli_dependencies()
+
+    assert exc_info.value.code == 1
+    assert "  - python-dotenv" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    ("command", "expected"),
+    [("list", "No agents found."), ("help", "Usage:")],
+)
+def test_trivial_commands_skip_llm_stack(tmp_path, command, expected):
+    script = (
+        "import sys\n"
+        "from deepagents_cli.main import cli_main\n"
+        f"sys.argv = ['deepagents', '{command}']\n"
+        "cli_main()\n"
+        "print('langgraph' in sys.modules, 'deepagents' in sys.modules)\n"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "HOME": str(tmp_path)},
+    )
+
+    assert expected in result.stdout
+    assert result.stdout.strip().splitlines()[-1] == "False False"
+
+
+def test_get_loop_factory_prefers_uvloop(monkeypatch):
+    uvloop = pytest.importorskip("uvloop")
+    monkeypatch.setattr(sys, "platform", "linux")
+
+    assert get_loop_factory() is uvloop.new_event_loop
+
+
+def test_get_loop_factory_falls_back_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    assert get_loop_factory() is None
+
+
+def test_run_uses_loop_from_factory(monkeypatch):
+    import asyncio
+
+    created = []
+
+    def loop_factory():
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    monkeypatch.setattr("deepagents_cli.main.get_loop_factory", lambda: loop_factory)
+
+    async def answer():
+        return asyncio.get_running_loop()
+
+    assert _run(answer()) is created[0]
+    assert created[0].is_closed()
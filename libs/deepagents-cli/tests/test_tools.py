@@ -0,0 +1,44 @@
+from collections.abc import Callable
+from email.message import Message
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from deepagents_cli import tools
+
+
+def _fake_send(
+    sent: list[requests.PreparedRequest],
+) -> Callable[..., requests.Response]:
+    def send(request: requests.PreparedRequest, **_kwargs: object) -> requests.Response:
+        sent.append(request)
+        headers = Message()
+        headers["Set-Cookie"] = "session=abc; Path=/"
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response._content = b'{"ok": true}'
+        response.raw = SimpleNamespace(_original_response=SimpleNamespace(msg=headers))
+        return response
+
+    return send
+
+
+def test_http_request_reuses_pool_without_sharing_cookies(monkeypatch: pytest.MonkeyPatch):
+    sent = []
+    monkeypatch.setattr(tools._http_adapter, "send", _fake_send(sent))
+
+    first = tools.http_request("https://example.com/login")
+    second = tools.http_request("https://example.com/profile")
+
+    assert first["content"] == {"ok": True}
+    assert second["success"]
+    assert [request.url for request in sent] == [
+        "https://example.com/login",
+        "https://example.com/profile",
+    ]
+    assert "Cookie" not in sent[1].headers
+    assert len(tools._http_session.cookies) == 0